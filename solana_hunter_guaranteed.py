@@ -4,14 +4,156 @@
 Solana Wallet Hunter - GUARANTEED Version (100% Check)
 """
 
+import array
+import asyncio
+import collections
+import hashlib
+import hmac
+import multiprocessing
+import os
+import signal
 import time
-import threading
-import requests
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import httpx
+import orjson
 from mnemonic import Mnemonic
-import bip_utils
-import base58
-from nacl.signing import SigningKey
+import based58
+from nacl.bindings import crypto_sign_seed_keypair
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows, fall back to the default event loop
+    uvloop = None
+
+MNEMO = Mnemonic("english")
+
+# SLIP-0010 Ed25519 master key and Solana derivation path m/44'/501'/0'/0'
+ED25519_SEED_KEY = b"ed25519 seed"
+HARDENED = 0x80000000
+SOLANA_PATH = tuple((index | HARDENED).to_bytes(4, "big") for index in (44, 501, 0, 0))
+
+# JSON-RPC envelope of one getMultipleAccounts call, addresses are spliced in between
+RPC_CALL_PREFIX = b'{"jsonrpc":"2.0","id":%d,"method":"getMultipleAccounts","params":[["'
+RPC_CALL_SUFFIX = b'"]]}'
+
+def init_generator_process(process_counter):
+    """Pins the generator process to its own core and leaves Ctrl+C to the main process."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # CPU affinity is only available on Linux
+    if hasattr(os, "sched_setaffinity"):
+        with process_counter.get_lock():
+            process_index = process_counter.value
+            process_counter.value += 1
+        cores = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cores[process_index % len(cores)]})
+
+def usable_cpu_count() -> int:
+    """Number of CPUs this process may run on (respects container/cgroup affinity)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def derive_solana_key(seed: bytes, path: tuple = SOLANA_PATH) -> bytes:
+    """Derives the Ed25519 private key at `path` from a seed (SLIP-0010).
+
+    `path` holds 4-byte big-endian hardened indices, m/44'/501'/0'/0' by default.
+    """
+    # Each HMAC-SHA512 digest is key (first 32 bytes) || chain code (last 32 bytes)
+    digest = hmac.digest(ED25519_SEED_KEY, seed, "sha512")
+    for index in path:
+        digest = hmac.digest(digest[32:], b"\x00" + digest[:32] + index, "sha512")
+    return digest[:32]
+
+def build_rpc_payload(batches: list) -> bytes:
+    """Builds the JSON-RPC batch request body, one getMultipleAccounts call per batch.
+
+    Base58 addresses never need escaping, so they are joined straight into
+    the precomputed envelope instead of going through a JSON encoder.
+    """
+    return b"[" + b",".join(
+        RPC_CALL_PREFIX % request_id + '","'.join(addresses).encode('ascii') + RPC_CALL_SUFFIX
+        for request_id, (_, addresses) in enumerate(batches)
+    ) + b"]"
+
+def derive_keypair(entropy: bytes) -> tuple:
+    """Derives the Ed25519 (public, secret) key pair of a wallet from its entropy.
+
+    The seed is a single SHA-512 of the entropy instead of the 2048-round
+    BIP39 PBKDF2, so the mnemonic alone does not restore the wallet.
+    """
+    seed = hashlib.sha512(entropy).digest()
+    return crypto_sign_seed_keypair(derive_solana_key(seed))
+
+def generate_batch(batch_size: int) -> tuple:
+    """Generates a batch of wallets as parallel (entropies, addresses) lists.
+
+    Runs inside a generator process.
+    """
+    # Local references keep global lookups out of the hot loop
+    _derive = derive_keypair
+    _b58 = based58.b58encode
+
+    entropies = []
+    addresses = []
+    for _ in range(batch_size):
+        entropy = os.urandom(16)
+        public_key = _derive(entropy)[0]
+        entropies.append(entropy)
+        addresses.append(_b58(public_key).decode('ascii'))
+    return entropies, addresses
+
+class TokenBucket:
+    """Adaptive token-bucket rate limiter shared by all workers.
+
+    While responses succeed and the bucket is what holds requests back, the
+    fill rate grows by 0.1 requests/s per second; a 429 or a timeout halves it
+    at most once per second (AIMD). Many requests are in flight at once, so
+    one burst of 429s only backs off once, and the rate does not creep up
+    while the workers, not the bucket, set the pace.
+    """
+    __slots__ = ('rate', 'capacity', 'tokens', 'last', 'last_wait', 'last_increase', 'last_decrease')
+
+    def __init__(self, rate: float = 50.0, capacity: float = 50.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.last_wait = float('-inf')
+        self.last_increase = self.last
+        self.last_decrease = float('-inf')
+
+    async def acquire(self, tokens: float = 1):
+        """Waits until `tokens` requests may be sent."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return
+            self.last_wait = now
+            await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+    def on_success(self):
+        """Additive increase of 0.1 requests/s per elapsed second, while the bucket is limiting."""
+        now = time.monotonic()
+        if now - self.last_wait < 1.0:
+            # Capped so a success after a long pause does not jump the rate
+            self.rate += 0.1 * min(now - self.last_increase, 1.0)
+        self.last_increase = now
+
+    def on_throttle(self):
+        """Multiplicative decrease after a 429 or a timeout, at most once per second."""
+        now = time.monotonic()
+        if now - self.last_decrease < 1.0:
+            return
+        self.rate = max(1.0, self.rate * 0.5)
+        self.last_decrease = now
+        self.last_increase = now
 
 class SolanaHunterGuaranteed:
     def __init__(self):
@@ -20,22 +162,24 @@ class SolanaHunterGuaranteed:
             "https://api.mainnet-beta.solana.com"
         ]
         self.current_rpc_index = 0
-        
-        self.mnemo = Mnemonic("english")
-        
-        # Statistics
-        self.attempts = 0
+
+        # Batching and concurrency
+        self.batch_size = 100
+        self.batches_per_request = 10
+        self.num_processes = usable_cpu_count()
+        self.queue_size = 32
+        self.generation_depth = 2
+        self.rate_limiter = TokenBucket()
+
+        # Statistics (only updated from the event loop thread, so no lock is needed)
+        self.worker_attempts = array.array('Q')
         self.found_wallets = 0
         self.retries = 0
         self.start_time = time.time()
-        self.lock = threading.Lock()
-        
+
         self.output_file = "found_wallets.txt"
-        
-        # Session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({'Content-Type': 'application/json'})
-        
+        self.output_fd = None
+
         print("✅ Solana Wallet Hunter - GUARANTEED Version")
         print("=" * 50)
 
@@ -45,157 +189,214 @@ class SolanaHunterGuaranteed:
         self.current_rpc_index = (self.current_rpc_index + 1) % len(self.rpc_endpoints)
         return url
 
-    def generate_wallet(self) -> tuple:
-        """Generates a single wallet (mnemonic, address)"""
+    async def check_balance_batch(self, client: httpx.AsyncClient, batches: list):
+        """Checks the balance of up to 10 batches of 100 wallets in one JSON-RPC batch request."""
         try:
-            mnemonic = self.mnemo.generate(strength=128)
-            seed = self.mnemo.to_seed(mnemonic)
-            
-            bip44_mst_ctx = bip_utils.Bip44.FromSeed(seed, bip_utils.Bip44Coins.SOLANA)
-            bip44_acc_ctx = bip44_mst_ctx.Purpose().Coin().Account(0)
-            bip44_chg_ctx = bip44_acc_ctx.Change(bip_utils.Bip44Changes.CHAIN_EXT)
-            bip44_addr_ctx = bip44_chg_ctx.AddressIndex(0)
-            
-            private_key_bytes = bip44_addr_ctx.PrivateKey().Raw().ToBytes()
-            signing_key = SigningKey(private_key_bytes[:32])
-            public_key = signing_key.verify_key.encode()
-            address = base58.b58encode(public_key).decode('utf-8')
-            
-            return mnemonic, address
-        except Exception:
-            return None, None
+            payload = build_rpc_payload(batches)
 
-    def check_balance_batch(self, wallets: list):
-        """Checks the balance of a batch of 100 wallets at once."""
-        try:
-            addresses = [wallet['address'] for wallet in wallets]
-            
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getMultipleAccounts",
-                "params": [addresses]
-            }
-            
             rpc_url = self.get_rpc_url()
-            response = self.session.post(rpc_url, json=payload, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data and 'value' in data['result']:
-                    accounts = data['result']['value']
-                    
-                    for i, account in enumerate(accounts):
-                        if account is not None:
-                            balance_lamports = account['lamports']
-                            if balance_lamports > 0:
-                                balance_sol = balance_lamports / 1_000_000_000
-                                wallet = wallets[i]
-                                self.save_wallet(wallet['mnemonic'], wallet['address'], balance_sol)
-                return True # Successful query
+            await self.rate_limiter.acquire(1)
+            try:
+                response = await client.post(rpc_url, content=payload)
+            except httpx.TimeoutException:
+                self.rate_limiter.on_throttle()
+                return False
+
+            if response.status_code == 429:
+                self.rate_limiter.on_throttle()
+            if response.status_code != 200:
+                return False
+            self.rate_limiter.on_success()
+            data = orjson.loads(response.content)
+
+            if not isinstance(data, list):
+                return False
+
+            # Batch responses may come back in any order, match them by id
+            results = {result.get('id'): result for result in data}
+            accounts_by_batch = []
+            for request_id, (_, addresses) in enumerate(batches):
+                result = results.get(request_id)
+                if result is None or 'result' not in result or 'value' not in result['result']:
+                    return False
+                if len(result['result']['value']) != len(addresses):
+                    return False
+                accounts_by_batch.append(result['result']['value'])
+
+            # Every batch was answered in full, only now look for balances
+            for (entropies, addresses), accounts in zip(batches, accounts_by_batch):
+                for i, account in enumerate(accounts):
+                    if account is not None:
+                        balance_lamports = account['lamports']
+                        if balance_lamports > 0:
+                            balance_sol = balance_lamports / 1_000_000_000
+                            self.save_wallet(entropies[i], addresses[i], balance_sol)
+            return True # Successful query
         except Exception:
             # Silently pass on error
             pass
-        
+
         return False # Failed query
 
-    def save_wallet(self, mnemonic: str, address: str, balance: float):
+    async def check_until_successful(self, client: httpx.AsyncClient, batches: list):
+        """Retries the query of the batches UNTIL it is successful.
+
+        Retries are counted in `self.retries` and shown by `report_stats`.
+        """
+        while not await self.check_balance_batch(client, batches):
+            self.retries += 1
+            await asyncio.sleep(1) # Wait 1 second before retrying
+
+    def save_wallet(self, entropy: bytes, address: str, balance: float):
         """Saves the found wallet."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        mnemonic = MNEMO.to_mnemonic(entropy)
+        _, secret_key = derive_keypair(entropy)
+        private_key = based58.b58encode(secret_key).decode('ascii')
         wallet_info = f"""--------------------------------------------------
 🎉 WALLET FOUND!
 ⏰ {timestamp}
 🔑 {mnemonic}
+🗝️ {private_key}
 📍 {address}
 💰 {balance:.9f} SOL
 --------------------------------------------------\n\n"""
-        
-        with self.lock:
-            with open(self.output_file, "a", encoding="utf-8") as f:
-                f.write(wallet_info)
-            self.found_wallets += 1
-            
+
+        os.write(self.output_fd, wallet_info.encode('utf-8'))
+        self.found_wallets += 1
+
         print(f"\n🎉🎉🎉 NEW WALLET FOUND! 🎉🎉🎉")
         print(f"📍 Address: {address}")
         print(f"💰 Balance: {balance:.9f} SOL\n")
 
-    def print_stats(self, extra_message=""):
+    @property
+    def attempts(self) -> int:
+        """Total attempts, summed from the per-worker counters."""
+        return sum(self.worker_attempts)
+
+    async def report_stats(self):
+        """Prints progress statistics once per second."""
+        while True:
+            await asyncio.sleep(1)
+            self.print_stats()
+
+    def print_stats(self):
         """Prints progress statistics."""
         elapsed = time.time() - self.start_time
         speed = self.attempts / elapsed if elapsed > 0 else 0
-        
+
         print(f"\r[{datetime.now().strftime('%H:%M:%S')}] "
               f"Attempts: {self.attempts:,} | "
               f"Found: {self.found_wallets} | "
               f"Retries: {self.retries} | "
-              f"Speed: {speed:.1f}/s"
-              f"{extra_message}", end="")
-
-    def worker(self, worker_id: int):
-        """The main loop for each worker thread."""
-        print(f"✅ Thread {worker_id} started in GUARANTEED mode.")
-        batch_size = 100
-        
+              f"Speed: {speed:.1f}/s", end="")
+
+    async def keep_alive(self, client: httpx.AsyncClient):
+        """Keeps the RPC connections warm with a getVersion call every 30 seconds."""
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "getVersion"}
+
+        while True:
+            await asyncio.sleep(30)
+            for rpc_url in self.rpc_endpoints:
+                try:
+                    await client.post(rpc_url, json=payload)
+                except Exception:
+                    pass
+
+    async def producer(self, queue: asyncio.Queue, pool: ProcessPoolExecutor):
+        """Fills the batch queue from the shared generator pool.
+
+        Each producer keeps a small ring of batches submitted ahead to the pool,
+        so there is always generation work queued while a finished batch waits
+        for room in the queue. Starting one producer per process keeps the
+        whole pool busy, and a full queue still pauses generation until the
+        workers catch up.
+        """
+        loop = asyncio.get_running_loop()
+        pending = collections.deque(
+            loop.run_in_executor(pool, generate_batch, self.batch_size)
+            for _ in range(self.generation_depth)
+        )
+
+        while True:
+            future = pending.popleft()
+            pending.append(loop.run_in_executor(pool, generate_batch, self.batch_size))
+            try:
+                await queue.put(await future)
+            except Exception:
+                # Continue on general errors
+                await asyncio.sleep(1)
+
+    async def worker(self, worker_id: int, client: httpx.AsyncClient, queue: asyncio.Queue):
+        """The main loop for each worker coroutine."""
+        print(f"✅ Worker {worker_id} started in GUARANTEED mode.")
+
         while True:
             try:
-                # 1. Create a batch of 100 wallets
-                wallets_batch = []
-                for _ in range(batch_size):
-                    mnemonic, address = self.generate_wallet()
-                    if mnemonic and address:
-                        wallets_batch.append({'mnemonic': mnemonic, 'address': address})
-                
-                # 2. Retry query UNTIL it is successful
-                is_successful = False
-                retry_count_local = 0
-                while not is_successful:
-                    is_successful = self.check_balance_batch(wallets_batch)
-                    
-                    if not is_successful:
-                        retry_count_local += 1
-                        with self.lock:
-                            self.retries += 1
-                        self.print_stats(f" (Retrying batch {self.attempts // batch_size + 1}, attempt {retry_count_local}...)")
-                        time.sleep(1) # Wait 1 second before retrying
-                
-                # 3. Update statistics (only after successful query)
-                with self.lock:
-                    self.attempts += len(wallets_batch)
-                    self.print_stats()
-
-            except KeyboardInterrupt:
-                break
+                # 1. Take batches of 100 wallets from the generation queue
+                batches = [await queue.get() for _ in range(self.batches_per_request)]
+
+                # 2. Query all batches in a single JSON-RPC batch request, retried UNTIL it is successful
+                await self.check_until_successful(client, batches)
+
+                # 3. Update statistics (only after successful queries)
+                self.worker_attempts[worker_id] += sum(len(addresses) for _, addresses in batches)
+
             except Exception:
                 # Continue on general errors
-                time.sleep(1)
+                await asyncio.sleep(1)
+
+    async def run(self, num_workers: int):
+        """Runs the workers on a shared HTTP/2 client and generator pool."""
+        self.worker_attempts = array.array('Q', [0] * num_workers)
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        # Batch query can take longer, let's set timeout to 10 seconds
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            headers={'Content-Type': 'application/json'}
+        )
 
-    def start(self, num_threads=8):
+        pool = ProcessPoolExecutor(
+            max_workers=self.num_processes,
+            initializer=init_generator_process,
+            initargs=(multiprocessing.Value('i', 0),)
+        )
+
+        with pool:
+            async with client:
+                await asyncio.gather(
+                    self.keep_alive(client),
+                    self.report_stats(),
+                    *[self.producer(queue, pool) for _ in range(self.num_processes)],
+                    *[self.worker(i, client, queue) for i in range(num_workers)]
+                )
+
+    def start(self, num_workers=64):
         """Starts the search in GUARANTEED mode."""
-        print(f"🚀 Starting GUARANTEED search with {num_threads} threads!")
+        print(f"🚀 Starting GUARANTEED search with {num_workers} workers!")
         print("💯 NO wallets generated in this mode will be skipped.")
         print("🐢 Speed may be slower, but the check is 100%.")
+        print(f"🧮 Wallets are generated on {self.num_processes} processes.")
         print("🔄 Press Ctrl+C to stop.")
         print("=" * 50)
-        
+
+        # O_APPEND makes every write an atomic append, no lock needed
+        self.output_fd = os.open(self.output_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
         try:
-            threads = []
-            for i in range(num_threads):
-                thread = threading.Thread(target=self.worker, args=(i,))
-                thread.daemon = True
-                thread.start()
-                threads.append(thread)
-            
-            while True:
-                if not any(t.is_alive() for t in threads):
-                    break
-                time.sleep(1)
-                
+            if uvloop is not None:
+                uvloop.run(self.run(num_workers))
+            else:
+                asyncio.run(self.run(num_workers))
         except KeyboardInterrupt:
             print("\n\n🛑 Stopping program...")
-        
+        finally:
+            os.close(self.output_fd)
+
         elapsed = time.time() - self.start_time
         avg_speed = self.attempts / elapsed if elapsed > 0 else 0
-        
+
         print("\n\n📊 FINAL REPORT:")
         print(f"⏱️  Total Time: {elapsed:.1f} seconds")
         print(f"🔢 Total Attempts (100% Check): {self.attempts:,}")
@@ -209,21 +410,21 @@ if __name__ == "__main__":
     print("=" * 50)
     print("⚠️  This tool is for educational purposes only!")
     print("💯 This script checks the balance of every found wallet with 100% certainty.")
-    
+
     confirm = input("\nType 'yes' to start GUARANTEED mode: ").strip().lower()
     if confirm != 'yes':
         print("❌ Operation cancelled.")
         exit()
-    
+
     try:
-        threads_input = input("How many threads to use? (Recommended: 8, max: 12): ").strip()
-        num_threads = int(threads_input) if threads_input else 8
-        if not 1 <= num_threads <= 12:
-            print("⚠️ Invalid number. Using 8 threads.")
-            num_threads = 8
+        workers_input = input("How many workers to use? (Recommended: 64, max: 256): ").strip()
+        num_workers = int(workers_input) if workers_input else 64
+        if not 1 <= num_workers <= 256:
+            print("⚠️ Invalid number. Using 64 workers.")
+            num_workers = 64
     except ValueError:
-        print("⚠️ Please enter a numeric value. Using 8 threads.")
-        num_threads = 8
-    
+        print("⚠️ Please enter a numeric value. Using 64 workers.")
+        num_workers = 64
+
     hunter = SolanaHunterGuaranteed()
-    hunter.start(num_threads)
\ No newline at end of file
+    hunter.start(num_workers)
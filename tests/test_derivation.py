@@ -0,0 +1,33 @@
+"""Tests for the SLIP-0010 key derivation of both hunters."""
+
+import importlib
+
+import pytest
+
+for dependency in ("httpx", "orjson", "mnemonic", "based58", "nacl"):
+    pytest.importorskip(dependency)
+
+# SLIP-0010 ed25519 test vector 1
+SEED = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+VECTOR_1 = [
+    ((), "2b4be7f19ee27bbf30c667b642d5f4aa69fd169872f8fc3059c08ebae2eb19e7"),
+    ((0,), "68e0fe46dfb67e368c75379acec591dad19df3cde26e63b93a8e704f1dade7a3"),
+    ((0, 1), "b1d0bad404bf35da785a64ca1ac54b2617211d2777696fbffaf208f746ae84f2"),
+    ((0, 1, 2, 2, 1000000000), "8f94d394a8e8fd6b1bc2f3f49f5c47e385281d5c17e65324b0f62483e37e8793"),
+]
+
+
+@pytest.fixture(params=["solana_hunter_pro", "solana_hunter_guaranteed"])
+def module(request):
+    return importlib.import_module(request.param)
+
+
+@pytest.mark.parametrize("indices, private_key", VECTOR_1)
+def test_slip10_ed25519_vector_1(module, indices, private_key):
+    path = tuple((index | module.HARDENED).to_bytes(4, "big") for index in indices)
+    assert module.derive_solana_key(SEED, path).hex() == private_key
+
+
+def test_default_path_is_solana(module):
+    path = tuple((index | module.HARDENED).to_bytes(4, "big") for index in (44, 501, 0, 0))
+    assert module.derive_solana_key(SEED) == module.derive_solana_key(SEED, path)
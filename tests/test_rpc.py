@@ -0,0 +1,122 @@
+"""Tests for the JSON-RPC batch request handling of both hunters."""
+
+import asyncio
+import importlib
+import json
+
+import pytest
+
+for dependency in ("httpx", "orjson", "mnemonic", "based58", "nacl"):
+    pytest.importorskip(dependency)
+
+
+@pytest.fixture(params=["solana_hunter_pro", "solana_hunter_guaranteed"])
+def module(request):
+    return importlib.import_module(request.param)
+
+
+def make_batches(count, size=3):
+    return [
+        ([bytes([k, i]) * 8 for i in range(size)], [f"Addr{k}x{i}" for i in range(size)])
+        for k in range(count)
+    ]
+
+
+def test_build_rpc_payload_is_a_json_rpc_batch(module):
+    batches = make_batches(3)
+
+    payload = json.loads(module.build_rpc_payload(batches))
+
+    assert payload == [
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "getMultipleAccounts",
+            "params": [addresses],
+        }
+        for request_id, (_, addresses) in enumerate(batches)
+    ]
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.content = json.dumps(body).encode()
+        self.status_code = status_code
+
+
+class FakeClient:
+    """Answers every call of a batch request through `respond(call)`, in reverse order."""
+
+    def __init__(self, respond):
+        self.respond = respond
+
+    async def post(self, url, content):
+        calls = json.loads(content)
+        return FakeResponse([self.respond(call) for call in reversed(calls)])
+
+
+def funded_second_account(call):
+    """A result where only the second address of each call holds a balance."""
+    value = [None, {"lamports": 2_000_000_000}] + [None] * (len(call["params"][0]) - 2)
+    return {"jsonrpc": "2.0", "id": call["id"], "result": {"context": {}, "value": value}}
+
+
+def check(hunter, batches, respond):
+    return asyncio.run(hunter.check_balance_batch(FakeClient(respond), batches))
+
+
+def capture_saves(hunter, monkeypatch):
+    """Records save_wallet calls instead of writing found_wallets.txt."""
+    saved = []
+    monkeypatch.setattr(hunter, "save_wallet", lambda entropy, address, balance: saved.append((entropy, address, balance)))
+    return saved
+
+
+def test_pro_counts_only_failed_sub_batches(monkeypatch):
+    hunter = importlib.import_module("solana_hunter_pro").SolanaHunterPro()
+    saved = capture_saves(hunter, monkeypatch)
+    batches = make_batches(10)
+
+    def respond(call):
+        if call["id"] == 4:
+            return {"jsonrpc": "2.0", "id": 4, "error": {"code": -32005, "message": "busy"}}
+        return funded_second_account(call)
+
+    assert check(hunter, batches, respond) == 1
+    expected = [(entropies[1], addresses[1], 2.0) for k, (entropies, addresses) in enumerate(batches) if k != 4]
+    assert saved == expected
+
+
+def test_pro_whole_request_failure_counts_every_batch(monkeypatch):
+    hunter = importlib.import_module("solana_hunter_pro").SolanaHunterPro()
+    saved = capture_saves(hunter, monkeypatch)
+
+    class RateLimitedClient:
+        async def post(self, url, content):
+            return FakeResponse({"error": "rate limited"}, status_code=429)
+
+    batches = make_batches(10)
+    assert asyncio.run(hunter.check_balance_batch(RateLimitedClient(), batches)) == 10
+    assert saved == []
+
+
+def test_guaranteed_matches_results_by_id(monkeypatch):
+    hunter = importlib.import_module("solana_hunter_guaranteed").SolanaHunterGuaranteed()
+    saved = capture_saves(hunter, monkeypatch)
+    batches = make_batches(3)
+
+    assert check(hunter, batches, funded_second_account) is True
+    assert saved == [(entropies[1], addresses[1], 2.0) for entropies, addresses in batches]
+
+
+def test_guaranteed_rejects_duplicate_and_missing_ids(monkeypatch):
+    hunter = importlib.import_module("solana_hunter_guaranteed").SolanaHunterGuaranteed()
+    saved = capture_saves(hunter, monkeypatch)
+    batches = make_batches(3)
+
+    def respond(call):
+        # Id 2 is answered twice and id 0 is missing, the count still matches
+        return funded_second_account(dict(call, id=2 if call["id"] == 0 else call["id"]))
+
+    assert check(hunter, batches, respond) is False
+    assert saved == []
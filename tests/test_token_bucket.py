@@ -0,0 +1,93 @@
+"""Tests for the adaptive TokenBucket rate limiter of both hunters."""
+
+import importlib
+
+import pytest
+
+for dependency in ("httpx", "orjson", "mnemonic", "based58", "nacl"):
+    pytest.importorskip(dependency)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, delay):
+        # Like a real sleep, never wake up early
+        self.now += delay + 1e-6
+
+
+@pytest.fixture(params=["solana_hunter_pro", "solana_hunter_guaranteed"])
+def bucket_and_clock(request, monkeypatch):
+    module = importlib.import_module(request.param)
+    clock = FakeClock()
+    monkeypatch.setattr(module.time, "monotonic", clock)
+    monkeypatch.setattr(module.asyncio, "sleep", clock.sleep)
+    return module.TokenBucket(rate=50.0), clock
+
+
+def acquire(bucket):
+    """Runs bucket.acquire() to completion; the fake sleep never suspends."""
+    with pytest.raises(StopIteration):
+        bucket.acquire().send(None)
+
+
+def test_concurrent_429s_back_off_once(bucket_and_clock):
+    bucket, clock = bucket_and_clock
+
+    # 256 in-flight requests all come back throttled at about the same time
+    for _ in range(256):
+        bucket.on_throttle()
+        clock.now += 0.001
+    assert bucket.rate == pytest.approx(25.0)
+
+    # The next burst a second later backs off once more
+    clock.now += 1.0
+    for _ in range(256):
+        bucket.on_throttle()
+    assert bucket.rate == pytest.approx(12.5)
+
+
+def test_increase_is_additive_per_second_while_limiting(bucket_and_clock):
+    bucket, clock = bucket_and_clock
+
+    # Workers send as fast as the bucket allows for 10 seconds
+    start = clock.now
+    while clock.now - start < 10:
+        acquire(bucket)
+        bucket.on_success()
+    assert bucket.rate == pytest.approx(51.0, abs=0.05)
+
+
+def test_no_increase_when_bucket_is_not_limiting(bucket_and_clock):
+    bucket, clock = bucket_and_clock
+
+    # An hour of 20 requests/s, well under the bucket's 50 requests/s
+    for _ in range(3600 * 20):
+        clock.now += 1 / 20
+        acquire(bucket)
+        bucket.on_success()
+    assert bucket.rate == pytest.approx(50.0)
+
+
+def test_rate_settles_under_mixed_responses(bucket_and_clock):
+    bucket, clock = bucket_and_clock
+
+    # The RPC accepts 30 requests/s and throttles everything above it
+    limit = 30.0
+    rates = []
+    start = clock.now
+    while clock.now - start < 120:
+        acquire(bucket)
+        if bucket.rate > limit:
+            bucket.on_throttle()
+        else:
+            bucket.on_success()
+        rates.append((clock.now - start, bucket.rate))
+
+    settled = [rate for elapsed, rate in rates if elapsed > 60]
+    assert min(settled) >= limit / 2 - 1
+    assert max(settled) <= limit + 1